@@ -1,35 +1,139 @@
 # ------------------------------------------
 # Build in modules
 # ------------------------------------------
+import asyncio
+import base64
+import functools
 import os
-import uuid
-from typing import Optional, Tuple, List, Dict, Any
+import time
+from typing import Optional, Tuple, List, Dict, Any, Iterable, Iterator
 
 # ------------------------------------------
 # 3rd party modules (installation needed)
 # ------------------------------------------
 
-from openai import OpenAI
-from qdrant_client import QdrantClient
+import grpc
+import numpy as np
+from openai import OpenAI, AsyncOpenAI, RateLimitError, APIConnectionError, InternalServerError, BadRequestError
+from qdrant_client import QdrantClient, AsyncQdrantClient
 from qdrant_client.grpc import ScoredPoint
-from qdrant_client.http.exceptions import ResponseHandlingException
-from qdrant_client.models import VectorParams, Distance, Batch
+from qdrant_client.http.exceptions import ApiException, ResponseHandlingException, UnexpectedResponse
+from qdrant_client.models import VectorParams, Distance, Batch, OptimizersConfigDiff, QueryRequest, \
+    BinaryQuantization, BinaryQuantizationConfig
+from tenacity import RetryCallState, retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+from tqdm import tqdm
 
 # ------------------------------------------
 # custom modules
 # ------------------------------------------
 None
 
+# Errors of the embeddings API that may not occur again when request is repeated
+RETRYABLE_OPEN_AI_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+# gRPC status codes of Qdrant that may not occur again when request is repeated
+RETRYABLE_GRPC_STATUS_CODES = (grpc.StatusCode.UNAVAILABLE,
+                               grpc.StatusCode.RESOURCE_EXHAUSTED,
+                               grpc.StatusCode.DEADLINE_EXCEEDED)
+# Longest wait time between retries in seconds
+MAX_RETRY_WAIT = 30
+
+
+def is_retryable_error(exception: BaseException) -> bool:
+    """
+    Check if request to the embeddings API or Qdrant failed because of rate limit or temporary connection problem.
+
+    Parameters
+    ----------
+    exception : BaseException
+        Exception raised by the request.
+
+    Returns
+    -------
+    bool
+        True if request may succeed when repeated, False otherwise.
+    """
+
+    if isinstance(exception, RETRYABLE_OPEN_AI_ERRORS + (ResponseHandlingException,)):
+        return True
+    if isinstance(exception, UnexpectedResponse):
+        return exception.status_code is not None and (exception.status_code == 429 or exception.status_code >= 500)
+    if isinstance(exception, grpc.RpcError):
+        return exception.code() in RETRYABLE_GRPC_STATUS_CODES
+    return False
+
+
+def wait_retry_after(retry_state: RetryCallState) -> float:
+    """
+    Get wait time before next retry. Value of 'Retry-After' header is used if server returned it,
+    exponential backoff with jitter is used otherwise. Wait time is limited to 'MAX_RETRY_WAIT'.
+
+    Parameters
+    ----------
+    retry_state : RetryCallState
+        State of the retried call.
+
+    Returns
+    -------
+    float
+        Wait time in seconds.
+    """
+
+    exception = retry_state.outcome.exception()
+    # OpenAI errors hold the response, Qdrant errors hold the headers
+    headers = getattr(getattr(exception, "response", None), "headers", None) or getattr(exception, "headers", None)
+
+    try:
+        return min(float(headers.get("retry-after")), MAX_RETRY_WAIT)
+    except (AttributeError, TypeError, ValueError):
+        return wait_exponential_jitter(initial=1, max=MAX_RETRY_WAIT)(retry_state)
+
+
+# Repeat requests failed because of rate limit or temporary connection problem
+retry_on_transient_error = retry(
+    retry=retry_if_exception(is_retryable_error),
+    stop=stop_after_attempt(5),
+    wait=wait_retry_after,
+    reraise=True,
+)
 
-class QdrantCustomClient():
 
-    def __init__(self):
+class QdrantCustomClient():
+    # OpenAI client shared by all instances, created on first use
+    shared_open_ai_client = None
+
+    def __init__(self,
+                 parallelism: int = 4,
+                 vectors_on_disk: bool = True,
+                 payload_on_disk: bool = True,
+                 binary_quantization: bool = True):
         self.__api_key__ = self.get_api_from_env_variable()
         self.__url___ = self.get_url_from_env_variable()
         self.vector_size = 1536
+        # Storage of created collections
+        self.vectors_on_disk = vectors_on_disk
+        self.payload_on_disk = payload_on_disk
+        self.binary_quantization = binary_quantization
         self.qdrant_client = self.initialize_qdrant_client()
-        self.open_ai_client = OpenAI()
+        self.async_qdrant_client = self.initialize_async_qdrant_client()
+        self.open_ai_client = self.get_shared_open_ai_client()
+        # Failed requests are repeated by 'retry_on_transient_error', not by the client
+        self.async_open_ai_client = AsyncOpenAI(max_retries=0)
         self.open_ai_embedding_model = "text-embedding-ada-002"
+        # Embeddings of last questions, repeated questions are not sent to the embeddings API again
+        self.create_cached_embedding = functools.lru_cache(maxsize=512)(self.create_embedding)
+        # Limits of single request to the embeddings API
+        self.open_ai_embedding_batch_size = 2000
+        self.open_ai_embedding_batch_max_tokens = 280000
+        # Estimation used instead of tokenizer, texts are mostly in Polish which needs more tokens than English
+        self.open_ai_characters_per_token = 3
+        self.parallelism = parallelism
+        # Number of points upserted to Qdrant in single request, embedding batches are split into smaller upserts
+        self.qdrant_upsert_batch_size = 512
+        # Number of points uploaded at once, more data is not read until one of the batches is finished
+        self.upload_max_pending_points = 2048 * parallelism
+        self.qdrant_indexing_threshold = 20000
+        # Collections known to exist, they are not checked in Qdrant again
+        self.known_collections = set()
 
     def get_env_variable(self, environment_variable_name: str):
         """
@@ -79,7 +183,7 @@ class QdrantCustomClient():
 
     def initialize_qdrant_client(self) -> QdrantClient:
         """
-        Initialize Qdrant client with provided URL and API Key
+        Initialize Qdrant client with provided URL and API Key. gRPC is used as transport protocol.
 
         Returns
         -------
@@ -91,14 +195,51 @@ class QdrantCustomClient():
             self.qdrant_client = QdrantClient(
                 url=self.__url___,
                 api_key=self.__api_key__,
+                prefer_grpc=True,
             )
             return self.qdrant_client
         except ResponseHandlingException as e:
             raise Exception(f"Failed to initialize Qdrant client: {e}")
 
+    def initialize_async_qdrant_client(self) -> AsyncQdrantClient:
+        """
+        Initialize asynchronous Qdrant client with provided URL and API Key. gRPC is used as transport protocol.
+
+        Returns
+        -------
+        AsyncQdrantClient
+            The initialized asynchronous Qdrant client.
+        """
+
+        try:
+            self.async_qdrant_client = AsyncQdrantClient(
+                url=self.__url___,
+                api_key=self.__api_key__,
+                prefer_grpc=True,
+            )
+            return self.async_qdrant_client
+        except ResponseHandlingException as e:
+            raise Exception(f"Failed to initialize asynchronous Qdrant client: {e}")
+
+    @classmethod
+    def get_shared_open_ai_client(cls) -> OpenAI:
+        """
+        Get OpenAI client shared by all instances. Client is created on first use, so its connections are reused.
+
+        Returns
+        -------
+        OpenAI
+            The shared OpenAI client.
+        """
+
+        if cls.shared_open_ai_client is None:
+            # Failed requests are repeated by 'retry_on_transient_error', not by the client
+            cls.shared_open_ai_client = OpenAI(max_retries=0)
+        return cls.shared_open_ai_client
+
     def collection_exists(self, collection_name: str) -> bool:
         """
-        Check if collection exists in the Qdrant client.
+        Check if collection exists in the Qdrant client. Collections already known to exist are not checked again.
 
         Parameters
         ----------
@@ -111,11 +252,18 @@ class QdrantCustomClient():
             True if collection exists, False otherwise.
         """
 
-        return self.qdrant_client.collection_exists(collection_name)
+        if collection_name in self.known_collections:
+            return True
+
+        collection_exist = self.qdrant_client.collection_exists(collection_name)
+        if collection_exist:
+            self.known_collections.add(collection_name)
+        return collection_exist
 
     def create_collection(self, collection_name: str) -> bool:
         """
-        Create collection for Qdrant client.
+        Create collection for Qdrant client. Vectors and payloads are stored on disk and vectors are binary quantized,
+        unless disabled in constructor.
 
         Parameters
         ----------
@@ -130,11 +278,20 @@ class QdrantCustomClient():
 
         try:
             # Create config
-            vectors_config = VectorParams(size=self.vector_size, distance=Distance.COSINE)
+            vectors_config = VectorParams(size=self.vector_size, distance=Distance.COSINE, on_disk=self.vectors_on_disk)
+            # Quantized vectors are kept in RAM, original vectors are used only for rescoring
+            quantization_config = None
+            if self.binary_quantization:
+                quantization_config = BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
             # Create collection
-            self.qdrant_client.create_collection(collection_name=collection_name, vectors_config=vectors_config)
-            # Check if the collection was created successfully.
-            return self.collection_exists(collection_name)
+            collection_created = self.qdrant_client.create_collection(collection_name=collection_name,
+                                                                      vectors_config=vectors_config,
+                                                                      quantization_config=quantization_config,
+                                                                      on_disk_payload=self.payload_on_disk)
+            # Remember the collection if it was created successfully.
+            if collection_created:
+                self.known_collections.add(collection_name)
+            return collection_created
         except Exception as e:
             raise Exception(f"Error during creating collection '{collection_name}' - {e}")
 
@@ -161,7 +318,7 @@ class QdrantCustomClient():
 
         return collection_exist
 
-    def count_points(self, collection_name: str) -> int:
+    def count_points(self, collection_name: str, exact: bool = False) -> int:
         """
         Get number of items (points) from specified collection.
 
@@ -169,6 +326,8 @@ class QdrantCustomClient():
         ----------
         collection_name : str
             The name of collection from which to retrieve points.
+        exact : bool
+            If True, count points exactly. Otherwise return faster approximate count. Default is False.
 
         Returns
         -------
@@ -177,13 +336,15 @@ class QdrantCustomClient():
         """
 
         try:
-            # Get qdrant collection
-            response = self.qdrant_client.get_collection(collection_name=collection_name)
             # Count points (items)
-            return response.points_count
-        except BaseException as e:
+            response = self.qdrant_client.count(collection_name=collection_name, exact=exact)
+            return response.count
+        except (ApiException, grpc.RpcError) as e:
+            # Collection may have been deleted, check it in Qdrant again next time
+            self.known_collections.discard(collection_name)
             raise Exception(f"Failed to retrieve Qdrant collection's '{collection_name}' points -  {e}")
 
+    @retry_on_transient_error
     def create_embedding(self, input_text: str) -> list[float]:
         """
         Convert string into embedding. Return list of numbers from -1 to 1.
@@ -199,72 +360,335 @@ class QdrantCustomClient():
             List of integers from -1 to 1 representing the embedded word.
         """
 
+        # Get response from embedding model
+        response = self.open_ai_client.embeddings.create(model=self.open_ai_embedding_model, input=input_text)
+        # Get embedding result
+        result = response.data[0].embedding
+        return result
+
+    def create_question_embedding(self, question: str) -> list[float]:
+        """
+        Convert question into embedding. Embeddings of last 512 questions are cached.
+
+        Parameters
+        ----------
+        question : str
+            Question to be converted into list of numbers.
+
+        Returns
+        -------
+        list[float]
+            List of numbers from -1 to 1 representing the question.
+        """
+
+        # Normalize question, so the same question written differently uses cached embedding
+        normalized_question = " ".join(question.split()).casefold()
+        return self.create_cached_embedding(normalized_question)
+
+    @retry_on_transient_error
+    def create_embeddings(self, input_texts: List[str]) -> List[List[float]]:
+        """
+        Convert list of strings into embeddings using single request to the embeddings API.
+
+        Parameters
+        ----------
+        input_texts : list[str]
+            Texts to be converted into lists of numbers.
+
+        Returns
+        -------
+        list[list[float]]
+            List of embeddings in the same order as 'input_texts'.
+        """
+
+        # Get response from embedding model for whole batch
+        response = self.open_ai_client.embeddings.create(model=self.open_ai_embedding_model, input=input_texts)
+        # Get embedding results, returned in the same order as input texts
+        return [item.embedding for item in response.data]
+
+    @retry_on_transient_error
+    async def create_embeddings_async(self, input_texts: List[str]) -> np.ndarray:
+        """
+        Convert list of strings into embeddings using single asynchronous request to the embeddings API.
+
+        Parameters
+        ----------
+        input_texts : list[str]
+            Texts to be converted into lists of numbers.
+
+        Returns
+        -------
+        np.ndarray
+            Array of float32 embeddings, one row for each text in the same order as 'input_texts'.
+        """
+
+        # Get response from embedding model for whole batch, embeddings are encoded as base64 float32 buffers
+        response = await self.async_open_ai_client.embeddings.create(model=self.open_ai_embedding_model,
+                                                                     input=input_texts,
+                                                                     encoding_format="base64")
+        # Decode embedding results, returned in the same order as input texts
+        return np.stack([np.frombuffer(base64.b64decode(item.embedding), dtype=np.float32)
+                         for item in response.data])
+
+    async def embed_json_batch(self, json_batch: List[Dict[str, str]], embedding_key_name: str) -> np.ndarray:
+        """
+        Create embeddings for batch of json items. If the batch is rejected by the embeddings API as invalid,
+        e.g. too large, it is split in half and each half is embedded separately.
+
+        Parameters
+        ----------
+        json_batch : list[dict[str,str]]
+            List of data in dictionary format.
+        embedding_key_name : str
+            Key of dictionary that contains text to be used in embedding process.
+
+        Returns
+        -------
+        np.ndarray
+            Array of float32 embeddings, one row for each json item in the same order as 'json_batch'.
+        """
+
+        input_texts = [json_item[embedding_key_name] for json_item in json_batch]
         try:
-            # Get response from embedding model
-            response = self.open_ai_client.embeddings.create(model=self.open_ai_embedding_model, input=input_text)
-            # Convert to dict
-            embedding = response.model_dump()
-            # Get embedding result
-            result = embedding["data"][0]["embedding"]
-            return result
-        except Exception as e:
-            raise Exception(f"Failed to request embeddings from the embeddings API: {e}")
+            return await self.create_embeddings_async(input_texts=input_texts)
+        except BadRequestError:
+            # Single item cannot be split
+            if len(json_batch) == 1:
+                raise
+            # Retry both halves of the batch, e.g. when estimated number of tokens was too low
+            half = len(json_batch) // 2
+            return np.concatenate([await self.embed_json_batch(json_batch[:half], embedding_key_name),
+                                   await self.embed_json_batch(json_batch[half:], embedding_key_name)])
+
+    def pack_json_batches(self,
+                          json_data: Iterable[Dict[str, str]],
+                          embedding_key_name: str
+                          ) -> Iterator[List[Dict[str, str]]]:
+        """
+        Split data into batches for the embeddings API. Batch is filled until the limit of items or the limit of
+        tokens is reached. Number of tokens is estimated from text length.
+
+        Parameters
+        ----------
+        json_data : Iterable[dict[str,str]]
+            Data in dictionary format.
+        embedding_key_name : str
+            Key of dictionary that contains text to be used in embedding process.
 
-    def upsert_qdrant_points(self,
-                             collection_name: str,
-                             json_data: List[Dict[str, str]],
-                             embedding_key_name: str = "info"
-                             ) -> None:
+        Returns
+        -------
+        Iterator[list[dict[str,str]]]
+            Batches of data in dictionary format.
         """
-        Upload data to specified collection in Qdrant.
+
+        json_batch = []
+        batch_tokens = 0
+
+        for json_item in json_data:
+            item_tokens = len(json_item[embedding_key_name]) // self.open_ai_characters_per_token + 1
+            # Start new batch if the item does not fit into current one
+            if json_batch and (len(json_batch) >= self.open_ai_embedding_batch_size
+                               or batch_tokens + item_tokens > self.open_ai_embedding_batch_max_tokens):
+                yield json_batch
+                json_batch = []
+                batch_tokens = 0
+
+            json_batch.append(json_item)
+            batch_tokens += item_tokens
+
+        if json_batch:
+            yield json_batch
+
+    @retry_on_transient_error
+    async def upsert_batch(self,
+                           collection_name: str,
+                           ids: List[int],
+                           payloads: List[Dict[str, str]],
+                           vectors: np.ndarray,
+                           wait: bool = False
+                           ) -> None:
+        """
+        Upsert batch of points to specified collection in Qdrant.
 
         Parameters
         ----------
         collection_name : str
-            The name of collection to which the data will be upserted..
-        json_data : list[dict[str,str]]
+            The name of collection to which the points will be upserted.
+        ids : list[int]
+            Unique Ids of points.
+        payloads : list[dict[str,str]]
+            Payloads of points.
+        vectors : np.ndarray
+            Array of embeddings, one row for each point.
+        wait : bool
+            If True, wait until the points are applied by Qdrant. Otherwise return once Qdrant received them.
+            Default is False.
+
+        Returns
+        -------
+        None
+        """
+
+        await self.async_qdrant_client.upsert(
+            collection_name=collection_name,
+            points=Batch(
+                ids=ids,
+                payloads=payloads,
+                vectors=vectors.tolist(),
+            ),
+            wait=wait,
+        )
+
+    async def upsert_json_batch(self,
+                                collection_name: str,
+                                ids: List[int],
+                                json_batch: List[Dict[str, str]],
+                                embedding_key_name: str,
+                                embedding_semaphore: asyncio.Semaphore,
+                                progress_bar: tqdm,
+                                wait: bool = False
+                                ) -> None:
+        """
+        Create embeddings for batch of json items and upsert them to specified collection in Qdrant.
+        Points are upserted in parts of 'qdrant_upsert_batch_size' points.
+
+        Parameters
+        ----------
+        collection_name : str
+            The name of collection to which the data will be upserted.
+        ids : list[int]
+            Unique Ids of points, one for each json item.
+        json_batch : list[dict[str,str]]
             List of data in dictionary format.
         embedding_key_name : str
             Key of dictionary that contains text to be used in embedding process.
+        embedding_semaphore : asyncio.Semaphore
+            Semaphore limiting number of concurrent requests to the embeddings API.
+        progress_bar : tqdm
+            Progress bar updated with number of upserted points.
+        wait : bool
+            If True, wait until the points are applied by Qdrant. Otherwise return once Qdrant received them.
+            Default is False.
 
         Returns
         -------
         None
         """
 
-        ids = []
-        payloads = []
-        vectors = []
-        counter = 0
+        # Create embeddings
+        async with embedding_semaphore:
+            vectors = await self.embed_json_batch(json_batch, embedding_key_name)
 
-        # Prepare points
-        for json_item in json_data:
-            # Generate unique Id for each point
-            ids.append(str(uuid.uuid4()))
-            # Add json item to playloads
-            payloads.append(json_item)
-            # Create embedding
-            vectors.append(
-                self.create_embedding(input_text=json_item[embedding_key_name])
-            )
+        # Upsert points in smaller parts, embeddings of other batches are created in the meantime
+        step = self.qdrant_upsert_batch_size
+        for start in range(0, len(ids), step):
+            end = start + step
+            # Qdrant applies updates in order, waiting for the last part is enough
+            await self.upsert_batch(collection_name, ids[start:end], json_batch[start:end], vectors[start:end],
+                                    wait and end >= len(ids))
 
             # Display progress of method
-            counter += 1
-            if counter % 100 == 0:
-                print(f"Prepare json: {counter}")
+            progress_bar.update(len(ids[start:end]))
+
+    async def upsert_qdrant_points(self,
+                                   collection_name: str,
+                                   json_data: Iterable[Dict[str, str]],
+                                   embedding_key_name: str = "info",
+                                   verbose: bool = True
+                                   ) -> int:
+        """
+        Upload data to specified collection in Qdrant.
+        Data is read in batches, each batch is embedded and upserted while next batches are read.
+        Only limited number of points is held in memory at once.
+
+        Parameters
+        ----------
+        collection_name : str
+            The name of collection to which the data will be upserted..
+        json_data : Iterable[dict[str,str]]
+            Data in dictionary format, e.g. list or generator streaming data from server.
+        embedding_key_name : str
+            Key of dictionary that contains text to be used in embedding process.
+        verbose : bool
+            If True, display progress bar. Default is True.
+
+        Returns
+        -------
+        int
+            Number of upserted points.
+        """
+
+        json_batches = self.pack_json_batches(json_data, embedding_key_name)
+        # Limit number of concurrent requests to the embeddings API
+        embedding_semaphore = asyncio.Semaphore(self.parallelism)
+        # Generate unique Id for each point, numbering starts from current time in microseconds
+        first_id = time.time_ns() // 1000
+        next_id = first_id
+        # Running upload tasks with number of points of each task
+        upsert_tasks = {}
+        progress_bar = tqdm(desc="Upsert json", unit="point", disable=not verbose)
+        indexing_disabled = False
+        upload_succeeded = False
 
         try:
-            self.qdrant_client.upsert(
+            # Disable indexing during bulk upload
+            await self.async_qdrant_client.update_collection(
                 collection_name=collection_name,
-                points=Batch(
-                    ids=ids,
-                    payloads=payloads,
-                    vectors=vectors,
-                ),
+                optimizers_config=OptimizersConfigDiff(indexing_threshold=0),
             )
-
+            indexing_disabled = True
+            # Read batch in separate thread, reading may wait for data from server
+            json_batch = await asyncio.to_thread(next, json_batches, [])
+            while json_batch:
+                # Wait until batches are finished, while too many points are held in memory
+                while sum(upsert_tasks.values()) >= self.upload_max_pending_points:
+                    finished_tasks, _ = await asyncio.wait(upsert_tasks, return_when=asyncio.FIRST_COMPLETED)
+                    for finished_task in finished_tasks:
+                        del upsert_tasks[finished_task]
+                        # Raise error of failed batch
+                        finished_task.result()
+
+                next_json_batch = await asyncio.to_thread(next, json_batches, [])
+                ids = list(range(next_id, next_id + len(json_batch)))
+                next_id += len(json_batch)
+
+                if next_json_batch:
+                    # Embed and upsert batch concurrently with others, without waiting for Qdrant to apply it
+                    upsert_task = asyncio.create_task(
+                        self.upsert_json_batch(collection_name, ids, json_batch, embedding_key_name,
+                                               embedding_semaphore, progress_bar)
+                    )
+                    upsert_tasks[upsert_task] = len(json_batch)
+                else:
+                    # Qdrant applies updates in order, waiting for the last batch makes sure all points are applied
+                    await asyncio.gather(*upsert_tasks)
+                    await self.upsert_json_batch(collection_name, ids, json_batch, embedding_key_name,
+                                                 embedding_semaphore, progress_bar, wait=True)
+
+                json_batch = next_json_batch
+
+            upload_succeeded = True
+            return next_id - first_id
         except Exception as e:
+            # Collection may have been deleted, check it in Qdrant again next time
+            self.known_collections.discard(collection_name)
             raise Exception(f"Failed to upsert points to Qdrant for collection '{collection_name}': {e}")
+        finally:
+            # Stop batches that are still running, also when upload was cancelled
+            for upsert_task in upsert_tasks:
+                upsert_task.cancel()
+            progress_bar.close()
+            if indexing_disabled:
+                try:
+                    # Enable indexing again
+                    await self.async_qdrant_client.update_collection(
+                        collection_name=collection_name,
+                        optimizers_config=OptimizersConfigDiff(indexing_threshold=self.qdrant_indexing_threshold),
+                    )
+                except Exception as e:
+                    # Do not replace error of failed upload, it describes the cause
+                    if upload_succeeded:
+                        raise Exception(f"Failed to enable indexing for collection '{collection_name}': {e}")
 
     # CHeckedc
     # CHeckedc
@@ -294,7 +718,7 @@ class QdrantCustomClient():
         """
 
         # Convert question into embedding.
-        question_vector = self.create_embedding(input_text=question)
+        question_vector = self.create_question_embedding(question=question)
 
         try:
             answers = self.qdrant_client.search(
@@ -305,4 +729,42 @@ class QdrantCustomClient():
 
             return answers
         except Exception as e:
-            raise Exception(f"Failed to search for point in Qdrant for collection '{collection_name}'- {e}.")
\ No newline at end of file
+            raise Exception(f"Failed to search for point in Qdrant for collection '{collection_name}'- {e}.")
+
+    def search_for_points_batch(self,
+                                collection_name: str,
+                                questions: List[str],
+                                answers_limit: int = 1
+                                ) -> list[list[ScoredPoint]]:
+        """
+        Find information in Vector database for many questions at once. Questions are embedded with single request
+        to the embeddings API and searched with single request to Qdrant.
+
+        Parameters
+        ----------
+        collection_name :str
+            The name of collection in which the search will be performed.
+        questions : list[str]
+            The questions used to find the closest information in vector database.
+        answers_limit : int
+            Number of answers return by vector database for each question. Default is 1.
+
+        Returns
+        -------
+        list[list[ScoredPoint]]
+            Answers found in the collection for each question, in the same order as 'questions'.
+        """
+
+        # Convert questions into embeddings.
+        question_vectors = self.create_embeddings(input_texts=questions)
+
+        try:
+            responses = self.qdrant_client.query_batch_points(
+                collection_name=collection_name,
+                requests=[QueryRequest(query=question_vector, limit=answers_limit, with_payload=True)
+                          for question_vector in question_vectors],
+            )
+
+            return [response.points for response in responses]
+        except Exception as e:
+            raise Exception(f"Failed to search for points in Qdrant for collection '{collection_name}'- {e}.")
@@ -1,11 +1,13 @@
 # ------------------------------------------
 # Build in modules
 # ------------------------------------------
-None
+import asyncio
+from typing import Iterator
 
 # ------------------------------------------
 # 3rd party modules (installation needed)
 # ------------------------------------------
+import ijson
 import requests
 
 # ------------------------------------------
@@ -17,9 +19,9 @@ from Libraries.qdrant_custom.qdrant_custom import QdrantCustomClient
 DATA_WEB_URL = 'https://unknow.news/archiwum_aidevs.json'
 
 
-def retrieve_json_data_from_url(json_url: str) -> list[dict[str, any]]:
+def retrieve_json_data_from_url(json_url: str) -> Iterator[dict[str, any]]:
     """
-    Retrieve data from specified url
+    Retrieve data from specified url. Data is streamed, items are returned while response is downloaded.
 
     Parameters
     ----------
@@ -28,17 +30,19 @@ def retrieve_json_data_from_url(json_url: str) -> list[dict[str, any]]:
 
     Returns
     -------
-    list[dict[str, any]]
-        List of data in dictionary format.
+    Iterator[dict[str, any]]
+        Data in dictionary format.
     """
 
     try:
         # Send get request to specified Url
-        response = requests.get(url=json_url)
-        # Check if request was successful.
-        response.raise_for_status()
-        # Parse JSON response.
-        return response.json()
+        with requests.get(url=json_url, stream=True) as response:
+            # Check if request was successful.
+            response.raise_for_status()
+            # Decompress response if server compressed it.
+            response.raw.decode_content = True
+            # Parse JSON response item by item.
+            yield from ijson.items(response.raw, "item", use_float=True)
     except Exception as e:
         raise Exception(f"Failed to retrieve JSON data from URL - {e}")
 
@@ -48,6 +52,22 @@ class UserInterface():
     def __init__(self) -> None:
         self.answer_limit = 1
         self.qdrant_collection_name = "s004_qdrant_search"
+        self.qdrant_custom_client = None
+        # Event loop is kept for whole application, asynchronous clients are bound to it
+        self.event_loop = asyncio.new_event_loop()
+
+    def get_qdrant_custom_client(self) -> QdrantCustomClient:
+        """
+        Get qdrant client. Client is created on first use and reused by all commands.
+
+        Returns
+        -------
+        QdrantCustomClient
+            The qdrant client.
+        """
+        if self.qdrant_custom_client is None:
+            self.qdrant_custom_client = QdrantCustomClient()
+        return self.qdrant_custom_client
 
     def help(self) -> None:
         """
@@ -144,11 +164,8 @@ class UserInterface():
         None
         """
         try:
-            # Get data from url
-            data = retrieve_json_data_from_url(DATA_WEB_URL)
-
-            # Create qdrant client
-            qdrant_custom_client = QdrantCustomClient()
+            # Get qdrant client
+            qdrant_custom_client = self.get_qdrant_custom_client()
 
             # Make sure collection exists
             collection_exists = qdrant_custom_client.recreate_qdrant_collection(self.qdrant_collection_name)
@@ -164,15 +181,14 @@ class UserInterface():
                 raise Exception(
                     f"Collection '{self.qdrant_collection_name}' is not empty. Clear collection before continuing the script.")
 
-            # Upsert data
-            qdrant_custom_client.upsert_qdrant_points(self.qdrant_collection_name, data)
-            # Count points in qdrant collection
-            qdrant_points = qdrant_custom_client.count_points(self.qdrant_collection_name)
+            # Get data from url, data is downloaded during upsert
+            data = retrieve_json_data_from_url(DATA_WEB_URL)
 
-            # If qdrant collection is not equal to data, raise exception
-            if qdrant_points != len(data):
-                raise Exception(f"Not all data was uploaded into collection {qdrant_points}/{len(data)}")
-            print("Data upsert to qdrant vector database successfully.")
+            # Upsert data
+            upserted_points = self.event_loop.run_until_complete(
+                qdrant_custom_client.upsert_qdrant_points(self.qdrant_collection_name, data)
+            )
+            print(f"Data upsert to qdrant vector database successfully. Upserted points: {upserted_points}")
         except Exception as e:
             print(f"Error: {e}")
 
@@ -192,8 +208,8 @@ class UserInterface():
         try:
             # Get question from user
             question = input("Write what do you want to know:")
-            # Create qdrant client
-            qdrant_custom_client = QdrantCustomClient()
+            # Get qdrant client
+            qdrant_custom_client = self.get_qdrant_custom_client()
 
             # Search qdrant for answer
             qdrant_answers = qdrant_custom_client.search_for_point(self.qdrant_collection_name, question,